@@ -2,7 +2,9 @@
 Pluggable agent personas with natural conversation behavior.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+
+import orjson
 
 # Shared instructions injected into every preset
 CONVERSATION_BEHAVIOR = """
@@ -30,12 +32,12 @@ Turn-Taking:
 """
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentPreset:
     name: str
     system_prompt: str
     voice: str = "Kore"
-    tools_enabled: list[str] = field(default_factory=list)
+    tools_enabled: tuple[str, ...] = ()
     description: str = ""
 
 
@@ -44,7 +46,7 @@ AGENT_PRESETS: dict[str, AgentPreset] = {
         name="General Assistant",
         description="A friendly, general-purpose voice assistant.",
         voice="Kore",
-        tools_enabled=["google_search"],
+        tools_enabled=("google_search",),
         system_prompt=CONVERSATION_BEHAVIOR + """
 Role: You are a friendly, helpful AI assistant having a natural voice conversation.
 
@@ -60,7 +62,7 @@ Additional Guidelines:
         name="Homework Tutor",
         description="A patient tutor that can see and help with homework problems.",
         voice="Puck",
-        tools_enabled=["google_search"],
+        tools_enabled=("google_search",),
         system_prompt=CONVERSATION_BEHAVIOR + """
 Role: You are a patient, encouraging tutor having a voice conversation with a student.
 
@@ -78,7 +80,7 @@ Additional Guidelines:
         name="Real-Time Translator",
         description="A translator that works with speech and can read text from camera.",
         voice="Charon",
-        tools_enabled=[],
+        tools_enabled=(),
         system_prompt=CONVERSATION_BEHAVIOR + """
 Role: You are a real-time translation assistant.
 
@@ -95,7 +97,7 @@ Additional Guidelines:
         name="Cooking Assistant",
         description="A kitchen companion that can see ingredients and suggest recipes.",
         voice="Kore",
-        tools_enabled=["google_search"],
+        tools_enabled=("google_search",),
         system_prompt=CONVERSATION_BEHAVIOR + """
 Role: You are a friendly cooking assistant having a voice conversation.
 
@@ -111,18 +113,32 @@ Additional Guidelines:
 
 DEFAULT_PRESET = "general"
 
+# Module-level binding for the fallback preset — get_agent_preset does one
+# dict lookup instead of two on every connect.
+_DEFAULT = AGENT_PRESETS[DEFAULT_PRESET]
+
+# The preset table is static, so the /api/agents payload is too. Build the
+# list (and its serialized form) once at import time instead of per request.
+_PRESET_LIST: list[dict] = [
+    {
+        "id": key,
+        "name": preset.name,
+        "description": preset.description,
+        "voice": preset.voice,
+    }
+    for key, preset in AGENT_PRESETS.items()
+]
+_PRESET_LIST_JSON: bytes = orjson.dumps({"agents": _PRESET_LIST})
+
 
 def get_agent_preset(name: str) -> AgentPreset:
-    return AGENT_PRESETS.get(name, AGENT_PRESETS[DEFAULT_PRESET])
+    return AGENT_PRESETS.get(name) or _DEFAULT
 
 
 def list_agent_presets() -> list[dict]:
-    return [
-        {
-            "id": key,
-            "name": preset.name,
-            "description": preset.description,
-            "voice": preset.voice,
-        }
-        for key, preset in AGENT_PRESETS.items()
-    ]
\ No newline at end of file
+    return _PRESET_LIST
+
+
+def list_agent_presets_bytes() -> bytes:
+    """Pre-serialized {"agents": [...]} payload for the REST route."""
+    return _PRESET_LIST_JSON
\ No newline at end of file
@@ -1,7 +1,7 @@
-from pydantic_settings import BaseSettings
-from functools import lru_cache
 from pathlib import Path
 
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
 # Find root .env (one level up from backend/)
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
 ENV_FILE = ROOT_DIR / ".env"
@@ -30,12 +30,23 @@ class Settings(BaseSettings):
     max_sessions: int = 50
     session_timeout_seconds: int = 3600
 
-    class Config:
-        env_file = str(ENV_FILE)
-        env_file_encoding = "utf-8"
-        extra = "ignore"  
+    # Audio micro-batching (latency/throughput knob): flush buffered PCM
+    # to Gemini at this many bytes (~100ms of 16kHz mono int16) or after
+    # this many milliseconds, whichever comes first.
+    audio_flush_bytes: int = 3200
+    audio_flush_ms: int = 60
+
+    model_config = SettingsConfigDict(
+        env_file=str(ENV_FILE),
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+
+
+# Parsed once at import; frozen so it can be shared freely across sessions.
+settings = Settings()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    return Settings()
\ No newline at end of file
+    return settings
\ No newline at end of file
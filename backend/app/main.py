@@ -7,11 +7,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.routers import ws, api
-from app.services.session_manager import session_manager
-from app.services.firestore import init_firestore
 
 # Configure logging
 logging.basicConfig(
@@ -20,16 +19,36 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:
+    # libuv-backed event loop: C-coded tasks/futures cut asyncio
+    # scheduler overhead on the websocket forwarders. uvicorn's "auto"
+    # loop already picks uvloop up when present; installing the policy
+    # here covers any other entrypoint (scripts, test runners) too.
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown lifecycle."""
+    # Deferred imports: keep the google-cloud SDK out of the module import
+    # graph so `import app.main` stays fast (Cloud Run cold start).
+    from app.services.firestore import init_firestore, shutdown_firestore
+    from app.services.session_manager import session_manager
+
     settings = get_settings()
     logger.info(f"Starting Live Agent backend (debug={settings.debug})")
 
     # Initialize Firestore
     init_firestore()
 
+    # Warm the shared Gemini client now so the TLS handshake and channel
+    # setup happen at startup, not on the first user-facing connect.
+    from app.services.gemini_live import get_gemini_client
+    get_gemini_client()
+
     # Start session cleanup background task
     await session_manager.start_cleanup_loop(interval=60)
 
@@ -38,6 +57,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     await session_manager.shutdown()
+    await shutdown_firestore()
 
 
 def create_app() -> FastAPI:
@@ -47,6 +67,9 @@ def create_app() -> FastAPI:
         title="Gemini Live Agent",
         version="1.0.0",
         lifespan=lifespan,
+        # orjson for all REST responses — /api/health is hit by liveness
+        # probes every few seconds, so skip jsonable_encoder + json.dumps.
+        default_response_class=ORJSONResponse,
     )
 
     # CORS — allow frontend origins
@@ -2,9 +2,9 @@
 REST API endpoints for health checks, session info, and agent management.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Response
 
-from app.agents.presets import list_agent_presets
+from app.agents.presets import list_agent_presets_bytes
 from app.services.session_manager import session_manager
 
 router = APIRouter(prefix="/api")
@@ -22,13 +22,20 @@ async def health_check():
 @router.get("/agents")
 async def list_agents():
     """List available agent presets (for frontend dropdown)."""
-    return {"agents": list_agent_presets()}
+    # Payload is invariant and serialized once at import — skip the
+    # jsonable_encoder + json.dumps pipeline entirely.
+    return Response(content=list_agent_presets_bytes(), media_type="application/json")
 
 
 @router.get("/sessions")
-async def get_sessions():
+async def get_sessions(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+):
     """Get stats about active sessions (for monitoring)."""
-    return session_manager.get_stats()
+    stats = session_manager.get_stats()
+    stats["sessions"] = session_manager.get_sessions_page(offset, limit)
+    return stats
 
 
 @router.post("/sessions/{session_id}/end")
@@ -3,24 +3,133 @@ WebSocket endpoint with interruption context tracking.
 """
 
 import asyncio
-import base64
-import json
 import logging
-
+import re
+import time
+from collections import deque
+
+try:
+    # SIMD-accelerated (SSSE3/AVX2) base64 — drop-in stdlib replacement,
+    # several times faster on camera-frame-sized payloads.
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel, ValidationError
 
 from app.agents.presets import get_agent_preset
-from app.services.gemini_live import (
-    get_gemini_client,
-    build_live_config,
-    LiveSession,
-)
+from app.config import settings
 from app.services.session_manager import session_manager
 from app.services import firestore
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Pre-serialized control frames — these are invariant, so encode them once
+# instead of running a JSON serializer per turn boundary.
+_TURN_COMPLETE_FRAME = '{"type":"turn_complete"}'
+_INTERRUPTED_FRAME = '{"type":"interrupted","partial_text":""}'
+
+# Binary frame tags: each binary WebSocket frame starts with a 1-byte tag
+# so images skip the JSON/base64 path entirely (no decode, ~25% less wire).
+_TAG_AUDIO = 0x01  # raw PCM audio
+_TAG_IMAGE = 0x02  # JPEG camera frame
+
+# Gemini→client event queue bound and how many ~20ms audio chunks may be
+# coalesced into one WebSocket send.
+_EVENT_QUEUE_MAX = 64
+_AUDIO_COALESCE_MAX = 4
+
+# How often a busy forwarder bothers stamping last_activity.
+_TOUCH_INTERVAL_SECONDS = 0.5
+
+# Extracts the base64 payload from a legacy {"type":"image","data":"..."}
+# frame without parsing hundreds of KB of JSON into a dict.
+_IMG_DATA_RE = re.compile(r'"data"\s*:\s*"([^"]+)"')
+
+
+# App-level write buffer for outgoing audio bursts. asyncio's default
+# 64KiB high-water mark makes send_bytes await drain() mid-burst, head-of-
+# line blocking the Gemini→client forwarder behind a slow reader.
+_WS_WRITE_BUFFER_HIGH = 1024 * 1024
+
+
+def _raise_write_buffer(ws: WebSocket) -> None:
+    """
+    Best-effort: raise the transport write-buffer high-water mark so
+    bursty audio rides the kernel TCP buffer instead of stalling on
+    drain(). The transport isn't part of the ASGI contract, so reach for
+    it defensively and accept a no-op on servers that don't expose it.
+    """
+    try:
+        protocol = getattr(ws._send, "__self__", None)
+        transport = getattr(protocol, "transport", None)
+        if transport is not None:
+            transport.set_write_buffer_limits(high=_WS_WRITE_BUFFER_HIGH)
+    except Exception:
+        pass
+
+
+async def _send_json(ws: WebSocket, payload: dict) -> None:
+    """Serialize with orjson instead of stdlib json (ws.send_json)."""
+    await ws.send_text(orjson.dumps(payload).decode())
+
+
+class _ConfigMsg(BaseModel):
+    """
+    Optional first client frame: {"type": "config", "preset": "..."}.
+    Parsed with model_validate_json — one C-level pass (jiter) straight
+    into a typed object instead of json.loads plus manual .get checks,
+    and malformed frames are rejected in the same step.
+    """
+
+    type: str = ""
+    preset: str = "general"
+
+
+class _EventQueue:
+    """
+    Bounded Gemini→client event buffer with audio load-shedding.
+
+    When the client reads slower than Gemini produces, the oldest
+    buffered *audio* chunk is evicted to make room — recent audio wins,
+    matching how a listener experiences lag. Control and text events
+    (turn_complete, interrupted, transcripts) are never dropped; if the
+    buffer holds nothing but those, it grows past the cap rather than
+    lose a turn boundary.
+    """
+
+    __slots__ = ("_maxsize", "_audio_tag", "_items", "_ready", "dropped_audio")
+
+    def __init__(self, maxsize: int, audio_tag: int):
+        self._maxsize = maxsize
+        self._audio_tag = audio_tag
+        self._items: deque = deque()
+        self._ready = asyncio.Event()
+        self.dropped_audio = 0
+
+    def push(self, event: tuple) -> None:
+        if len(self._items) >= self._maxsize:
+            items = self._items
+            for i, item in enumerate(items):
+                if item[0] == self._audio_tag:
+                    del items[i]
+                    self.dropped_audio += 1
+                    break
+        self._items.append(event)
+        self._ready.set()
+
+    async def get(self) -> tuple:
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    def empty(self) -> bool:
+        return not self._items
+
 
 class InterruptionTracker:
     """
@@ -73,33 +182,60 @@ class InterruptionTracker:
         )
 
 
-@router.websocket("/ws/session/{session_id}")
-async def websocket_endpoint(ws: WebSocket, session_id: str):
+async def websocket_endpoint(ws: WebSocket):
+    # Imported here (not at module top) so the google-genai SDK loads on
+    # first connect instead of at startup — route collection stays cheap.
+    from app.services.gemini_live import (
+        get_gemini_client,
+        build_live_config,
+        LiveSession,
+    )
+
+    session_id = ws.path_params["session_id"]
+
     await ws.accept()
+    _raise_write_buffer(ws)
     logger.info(f"WebSocket connected: {session_id}")
 
     user_session = session_manager.register(session_id)
     preset_id = "general"
     tracker = InterruptionTracker()
 
+    # First frame received during the config window if the client led
+    # with media instead of config — replayed into the forwarding loop
+    # so no audio is dropped.
+    pending_binary: bytes | None = None
+
     try:
         # ---- Step 1: Wait for optional config ----
-        try:
-            initial_msg = await asyncio.wait_for(ws.receive_text(), timeout=2.0)
-            msg = json.loads(initial_msg)
-            if msg.get("type") == "config":
-                preset_id = msg.get("preset", "general")
-                logger.info(f"Session {session_id} configured with preset: {preset_id}")
-        except (asyncio.TimeoutError, Exception):
-            pass
+        # A real client emits its config frame well under 250ms; one that
+        # leads with audio shouldn't stall session creation for seconds.
+        # asyncio.wait + done-set check instead of wait_for: no config is
+        # a normal outcome, not worth a raised TimeoutError per connect.
+        receive_task = asyncio.create_task(ws.receive())
+        done, _pending = await asyncio.wait({receive_task}, timeout=0.25)
+        if done:
+            first = receive_task.result()
+            if first.get("bytes"):
+                pending_binary = first["bytes"]
+            elif first.get("text"):
+                try:
+                    cfg = _ConfigMsg.model_validate_json(first["text"])
+                except ValidationError:
+                    cfg = None
+                if cfg is not None and cfg.type == "config":
+                    preset_id = cfg.preset
+                    logger.info(f"Session {session_id} configured with preset: {preset_id}")
+        else:
+            # Window elapsed with nothing on the wire — the client will
+            # get the default preset. Cancel before the forwarder starts
+            # its own receive loop (one reader at a time).
+            receive_task.cancel()
 
         # ---- Step 2: Create Gemini Live session ----
         preset = get_agent_preset(preset_id)
         user_session.agent_preset_id = preset_id
 
-        from app.config import get_settings
-        settings = get_settings()
-
         client = get_gemini_client()
         config = build_live_config(preset)
 
@@ -112,9 +248,12 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
             live_session = LiveSession(session=gemini_session, preset=preset)
             user_session.live_session = live_session
 
-            await firestore.log_session_start(session_id, preset_id)
+            # Fire-and-forget: the client shouldn't wait a Firestore RTT
+            # before hearing session_ready. spawn() tracks the task on the
+            # session so teardown can await it.
+            user_session.spawn(firestore.log_session_start(session_id, preset_id))
 
-            await ws.send_json({
+            await _send_json(ws, {
                 "type": "session_ready",
                 "session_id": session_id,
                 "agent": preset_id,
@@ -123,86 +262,150 @@ async def websocket_endpoint(ws: WebSocket, session_id: str):
             logger.info(f"Session {session_id} is live!")
 
             # ---- Step 3: Run bidirectional streaming ----
-            client_task = asyncio.create_task(
-                _forward_client_to_gemini(ws, live_session, user_session, tracker),
-                name=f"client-{session_id[:8]}",
-            )
-            gemini_task = asyncio.create_task(
-                _forward_gemini_to_client(ws, live_session, user_session, tracker),
-                name=f"gemini-{session_id[:8]}",
-            )
-
-            done, pending = await asyncio.wait(
-                [client_task, gemini_task],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            for task in done:
-                logger.info(f"Task '{task.get_name()}' completed first in session {session_id}")
-
-            for task in pending:
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
-
-            for task in done:
-                try:
-                    task.result()
-                except (WebSocketDisconnect, asyncio.CancelledError):
-                    pass
-                except Exception as e:
-                    logger.error(f"Task '{task.get_name()}' error: {e}")
-
-    except WebSocketDisconnect:
+            # Structured concurrency: the first side to fail cancels its
+            # sibling immediately, so the Gemini connection and the
+            # max_sessions slot are released without waiting for the
+            # partner's next await.
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(
+                    _forward_client_to_gemini(
+                        ws, live_session, user_session, tracker,
+                        first_frame=pending_binary,
+                    ),
+                    name=f"client-{session_id[:8]}",
+                )
+                tg.create_task(
+                    _forward_gemini_to_client(ws, live_session, user_session, tracker),
+                    name=f"gemini-{session_id[:8]}",
+                )
+
+    except* WebSocketDisconnect:
         logger.info(f"WebSocket disconnected: {session_id}")
-    except Exception as e:
-        logger.error(f"Session {session_id} error: {e}", exc_info=True)
+    except* Exception as eg:
+        error = eg.exceptions[0]
+        logger.error(f"Session {session_id} error: {error}", exc_info=error)
         try:
-            await ws.send_json({"type": "error", "message": str(e)})
+            await _send_json(ws, {"type": "error", "message": str(error)})
         except Exception:
             pass
     finally:
-        turn_count = len(user_session.turns)
+        turn_count = user_session.turn_count
         logger.info(
             f"Session {session_id} stats: {turn_count} turns, "
             f"{tracker.interruption_count} interruptions"
         )
-        await firestore.log_session_end(session_id, turn_count)
-        await session_manager.remove(session_id)
+        user_session.spawn(firestore.log_session_end(session_id, turn_count))
+        # recycle=True: the forwarders have exited and this endpoint is
+        # the last holder, so the object is safe to pool.
+        await session_manager.remove(session_id, recycle=True)
         logger.info(f"Session {session_id} fully cleaned up.")
 
 
+# Registered at the Starlette layer: @router.websocket would route the
+# connection through FastAPI's dependency solver and path-param
+# validation on every connect, which buys nothing here.
+router.add_websocket_route("/ws/session/{session_id}", websocket_endpoint)
+
+
+async def _handle_binary_frame(data: bytes, live_session: "LiveSession", user_session) -> None:
+    """Dispatch one tagged binary frame (see _TAG_*) to Gemini."""
+    tag = data[0]
+    # memoryview avoids copying the payload before it reaches the SDK —
+    # matters at 30fps camera frames.
+    if tag == _TAG_AUDIO:
+        await live_session.send_audio(memoryview(data)[1:])
+    elif tag == _TAG_IMAGE:
+        image_view = memoryview(data)[1:]
+        logger.info(
+            f"📷 Camera frame (binary): {len(image_view)} bytes "
+            f"(session {user_session.session_id[:8]})"
+        )
+        await live_session.send_image(image_view)
+        user_session.log_turn("user", "image")
+        firestore.log_turn(user_session.session_id, "user", "image")
+    else:
+        logger.debug(f"Ignoring binary frame with unknown tag {tag:#x}")
+
+
 async def _forward_client_to_gemini(
     ws: WebSocket,
-    live_session: LiveSession,
+    live_session: "LiveSession",
     user_session,
     tracker: InterruptionTracker,
+    first_frame: bytes | None = None,
 ) -> None:
     """Client audio/images/text → Gemini."""
+    last_touch = 0.0
     try:
+        # Replay a binary frame the client sent during the config window.
+        if first_frame:
+            await _handle_binary_frame(first_frame, live_session, user_session)
+
+        # Bound method hoisted out of the loop — one attribute lookup per
+        # connection instead of one per frame at ~50 frames/s.
+        ws_receive = ws.receive
+
         while live_session.is_active:
             try:
-                message = await ws.receive()
+                message = await ws_receive()
             except WebSocketDisconnect:
                 logger.info("Client WS disconnected in receive loop")
                 raise
             except RuntimeError:
+                # Receiving after disconnect raises RuntimeError — surface
+                # it as a disconnect so the TaskGroup cancels the partner
+                # instead of leaving it to idle until its next await.
                 logger.info("Client WS already disconnected")
-                break
+                raise WebSocketDisconnect(code=1000) from None
 
-            user_session.touch()
-
-            # Binary = raw PCM audio
-            if "bytes" in message and message["bytes"]:
-                await live_session.send_audio(message["bytes"])
+            # Audio frames arrive ~50x/s; stale-session cleanup only has
+            # minute granularity, so stamping last_activity twice a second
+            # is plenty. monotonic is the cheap (vDSO) clock here.
+            now = time.monotonic()
+            if now - last_touch > _TOUCH_INTERVAL_SECONDS:
+                user_session.touch()
+                last_touch = now
+
+            # One .get per channel instead of a membership test plus a
+            # subscript — audio frames only touch the first branch.
+            binary_frame = message.get("bytes")
+            if binary_frame:
+                # Binary = tagged frame: 1-byte tag + payload
+                await _handle_binary_frame(
+                    binary_frame, live_session, user_session
+                )
+                continue
 
             # Text = JSON command
-            elif "text" in message and message["text"]:
+            text_frame = message.get("text")
+            if text_frame:
+
+                # Anything that isn't a JSON object can't be a command —
+                # skip the parse attempt (and its exception) outright.
+                if text_frame[0] != "{":
+                    continue
+
+                # Legacy base64 image frames are hundreds of KB of JSON;
+                # pull the payload out with a regex instead of
+                # materializing the whole frame as a Python dict.
+                if text_frame.startswith('{"type":"image"'):
+                    match = _IMG_DATA_RE.search(text_frame)
+                    if match:
+                        image_bytes = base64.b64decode(match.group(1))
+                        logger.info(
+                            f"📷 Camera frame (legacy): {len(image_bytes)} bytes "
+                            f"(session {user_session.session_id[:8]})"
+                        )
+                        await live_session.send_image(image_bytes)
+                        user_session.log_turn("user", "image")
+                        firestore.log_turn(
+                            user_session.session_id, "user", "image"
+                        )
+                    continue
+
                 try:
-                    msg = json.loads(message["text"])
-                except json.JSONDecodeError:
+                    msg = orjson.loads(text_frame)
+                except orjson.JSONDecodeError:
                     continue
 
                 msg_type = msg.get("type", "")
@@ -217,7 +420,7 @@ async def _forward_client_to_gemini(
                         )
                         await live_session.send_image(image_bytes)
                         user_session.log_turn("user", "image")
-                        await firestore.log_turn(
+                        firestore.log_turn(
                             user_session.session_id, "user", "image"
                         )
 
@@ -242,7 +445,7 @@ async def _forward_client_to_gemini(
                         logger.info(f"User text: {text[:80]}")
                         await live_session.send_text(text)
                         user_session.log_turn("user", "text", text)
-                        await firestore.log_turn(
+                        firestore.log_turn(
                             user_session.session_id, "user", "text", text
                         )
 
@@ -257,91 +460,229 @@ async def _forward_client_to_gemini(
 
 async def _forward_gemini_to_client(
     ws: WebSocket,
-    live_session: LiveSession,
+    live_session: "LiveSession",
     user_session,
     tracker: InterruptionTracker,
 ) -> None:
-    """Gemini responses → Client with interruption tracking."""
-    try:
+    """
+    Gemini responses → Client with interruption tracking.
+
+    Split into a producer that pumps the Gemini stream into a bounded
+    queue and a sender that drains it to the WebSocket, so bursts of
+    audio chunks can be coalesced into single send_bytes calls instead
+    of one syscall per ~20ms frame. The queue sheds the oldest audio
+    when the client falls behind (see _EventQueue), so a slow reader
+    caps memory instead of growing the send backlog unbounded.
+    """
+    from app.services.gemini_live import EVENT_AUDIO
+
+    queue = _EventQueue(_EVENT_QUEUE_MAX, audio_tag=EVENT_AUDIO)
+
+    async def _pump_gemini_events() -> None:
         while live_session.is_active:
             event_count = 0
             async for event in live_session.receive():
                 event_count += 1
-                user_session.touch()
-                event_type = event["type"]
+                queue.push(event)
 
+            logger.warning(
+                f"Session {user_session.session_id}: Gemini receive stream ended "
+                f"after {event_count} events. Restarting receive loop..."
+            )
+            await asyncio.sleep(0.1)
+
+    producer = asyncio.create_task(_pump_gemini_events())
+    sender = asyncio.create_task(
+        _send_events_to_client(ws, queue, live_session, user_session, tracker)
+    )
+
+    done: set[asyncio.Task] = set()
+    try:
+        done, _pending = await asyncio.wait(
+            [producer, sender],
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+    finally:
+        for task in (producer, sender):
+            if not task.done():
+                task.cancel()
                 try:
-                    if event_type == "audio":
-                        await ws.send_bytes(event["data"])
-
-                    elif event_type == "text":
-                        # Track what the agent is saying for interruption context
-                        tracker.append_text(event["text"])
-
-                        await ws.send_json({
-                            "type": "transcript",
-                            "text": event["text"],
-                        })
-                        user_session.log_turn("assistant", "text", event["text"])
-                        await firestore.log_turn(
-                            user_session.session_id, "assistant", "text", event["text"]
-                        )
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+    if queue.dropped_audio:
+        logger.warning(
+            f"Session {user_session.session_id}: dropped "
+            f"{queue.dropped_audio} audio chunks (slow client)"
+        )
+    for task in done:
+        # Propagate the first failure to the endpoint's supervisor
+        task.result()
 
-                    elif event_type == "input_transcript":
-                        await ws.send_json({
-                            "type": "input_transcript",
-                            "text": event["text"],
-                        })
-                        user_session.log_turn("user", "text", event["text"])
 
-                    elif event_type == "interrupted":
-                        # Capture what was being said when interrupted
-                        interrupted_text = tracker.mark_interrupted()
-                        context_hint = tracker.build_context_hint(interrupted_text)
+async def _send_events_to_client(
+    ws: WebSocket,
+    queue: _EventQueue,
+    live_session: "LiveSession",
+    user_session,
+    tracker: InterruptionTracker,
+) -> None:
+    """
+    Drain queued Gemini events to the client WebSocket.
 
-                        logger.info(
-                            f"🛑 Interrupted after: \"{interrupted_text[:80]}...\" "
-                            f"(interruption #{tracker.interruption_count})"
-                        )
+    Consecutive audio chunks are buffered and flushed in one send_bytes
+    call when a non-audio event arrives, the queue drains empty, or the
+    buffer hits _AUDIO_COALESCE_MAX — text/control ordering relative to
+    audio is preserved.
+    """
+    from app.services.gemini_live import (
+        EVENT_AUDIO,
+        EVENT_TEXT,
+        EVENT_INPUT_TRANSCRIPT,
+        EVENT_INTERRUPTED,
+        EVENT_TURN_COMPLETE,
+        EVENT_TOOL_CALL,
+    )
+
+    pending_audio: list[bytes] = []
+
+    async def _flush_audio() -> None:
+        if not pending_audio:
+            return
+        if len(pending_audio) == 1:
+            await ws.send_bytes(pending_audio[0])
+        else:
+            await ws.send_bytes(b"".join(pending_audio))
+        pending_audio.clear()
+
+    # Transcript fragments accumulate here and are logged once per turn
+    # boundary — interim events still stream to the client live, but the
+    # turn log and Firestore see one entry per speaker per turn instead
+    # of one per fragment.
+    cur_user_text: list[str] = []
+    cur_asst_text: list[str] = []
+
+    def _flush_turn_logs() -> None:
+        if cur_user_text:
+            text = "".join(cur_user_text)
+            cur_user_text.clear()
+            user_session.log_turn("user", "text", text)
+            firestore.log_turn(user_session.session_id, "user", "text", text)
+        if cur_asst_text:
+            text = "".join(cur_asst_text)
+            cur_asst_text.clear()
+            user_session.log_turn("assistant", "text", text)
+            firestore.log_turn(
+                user_session.session_id, "assistant", "text", text
+            )
 
-                        # If we have meaningful context, inject it silently
-                        if context_hint:
-                            try:
-                                await live_session.send_text(context_hint)
-                                logger.info("💡 Interruption context injected")
-                            except Exception as e:
-                                logger.warning(f"Failed to inject context: {e}")
-
-                        # Tell frontend to fade out audio
-                        await ws.send_json({
-                            "type": "interrupted",
-                            "partial_text": interrupted_text[:200] if interrupted_text else "",
-                        })
-                        logger.debug(f"Session {user_session.session_id}: interrupted")
-
-                    elif event_type == "turn_complete":
-                        tracker.mark_turn_complete()
-                        await ws.send_json({"type": "turn_complete"})
-                        logger.info(
-                            f"Session {user_session.session_id}: "
-                            f"turn #{live_session.turn_count} complete"
-                        )
+    async def _on_text(payload) -> None:
+        # Track what the agent is saying for interruption context
+        tracker.append_text(payload)
 
-                    elif event_type == "tool_call":
-                        logger.info(f"Tool call: {event['tool_call']}")
+        await _send_json(ws, {
+            "type": "transcript",
+            "text": payload,
+        })
+        cur_asst_text.append(payload)
 
-                except (WebSocketDisconnect, RuntimeError):
-                    live_session.is_active = False
-                    break
+    async def _on_input_transcript(payload) -> None:
+        await _send_json(ws, {
+            "type": "input_transcript",
+            "text": payload,
+        })
+        cur_user_text.append(payload)
 
-            logger.warning(
-                f"Session {user_session.session_id}: Gemini receive stream ended "
-                f"after {event_count} events. Restarting receive loop..."
-            )
-            await asyncio.sleep(0.1)
+    async def _on_interrupted(payload) -> None:
+        # Capture what was being said when interrupted
+        interrupted_text = tracker.mark_interrupted()
+        context_hint = tracker.build_context_hint(interrupted_text)
 
-    except asyncio.CancelledError:
+        logger.info(
+            f"🛑 Interrupted after: \"{interrupted_text[:80]}...\" "
+            f"(interruption #{tracker.interruption_count})"
+        )
+
+        # If we have meaningful context, inject it silently
+        if context_hint:
+            try:
+                await live_session.send_text(context_hint)
+                logger.info("💡 Interruption context injected")
+            except Exception as e:
+                logger.warning(f"Failed to inject context: {e}")
+
+        # Tell frontend to fade out audio. Interruptions caught early in
+        # a turn carry no partial text — that frame is a constant.
+        if interrupted_text:
+            await _send_json(ws, {
+                "type": "interrupted",
+                "partial_text": interrupted_text[:200],
+            })
+        else:
+            await ws.send_text(_INTERRUPTED_FRAME)
+
+        # An interruption ends the turn — log what was said so far.
+        _flush_turn_logs()
+        logger.debug(f"Session {user_session.session_id}: interrupted")
+
+    async def _on_turn_complete(payload) -> None:
+        tracker.mark_turn_complete()
+        _flush_turn_logs()
+        await ws.send_text(_TURN_COMPLETE_FRAME)
+        logger.info(
+            f"Session {user_session.session_id}: "
+            f"turn #{live_session.turn_count} complete"
+        )
+
+    async def _on_tool_call(payload) -> None:
+        logger.info(f"Tool call: {payload}")
+
+    # Indexed by EVENT_* tag — audio is handled inline on the fast path
+    # below, so its slot stays None.
+    handlers: list = [None] * 6
+    handlers[EVENT_TEXT] = _on_text
+    handlers[EVENT_INPUT_TRANSCRIPT] = _on_input_transcript
+    handlers[EVENT_INTERRUPTED] = _on_interrupted
+    handlers[EVENT_TURN_COMPLETE] = _on_turn_complete
+    handlers[EVENT_TOOL_CALL] = _on_tool_call
+
+    last_touch = 0.0
+
+    try:
+        while True:
+            tag, payload = await queue.get()
+
+            # Same throttle as the client forwarder: liveness bookkeeping
+            # twice a second, not per 20ms audio chunk.
+            now = time.monotonic()
+            if now - last_touch > _TOUCH_INTERVAL_SECONDS:
+                user_session.touch()
+                last_touch = now
+
+            try:
+                if tag == EVENT_AUDIO:
+                    pending_audio.append(payload)
+                    if len(pending_audio) >= _AUDIO_COALESCE_MAX or queue.empty():
+                        await _flush_audio()
+                    continue
+
+                # Non-audio event: flush buffered audio first so the
+                # client never sees text ahead of the speech it captions.
+                await _flush_audio()
+
+                await handlers[tag](payload)
+
+            except (WebSocketDisconnect, RuntimeError):
+                # Propagate so the supervising TaskGroup tears the whole
+                # session down rather than leaving the producer running.
+                live_session.is_active = False
+                raise
+
+    except (asyncio.CancelledError, WebSocketDisconnect):
         raise
     except Exception as e:
         logger.error(f"Gemini→Client error: {e}")
-        raise
\ No newline at end of file
+        raise
+    finally:
+        # Don't lose the tail of a turn cut short by disconnect.
+        _flush_turn_logs()
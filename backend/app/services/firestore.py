@@ -6,6 +6,7 @@ Falls back gracefully if Firestore is unavailable (e.g., local dev
 without credentials).
 """
 
+import asyncio
 import logging
 import time
 
@@ -16,10 +17,23 @@ logger = logging.getLogger(__name__)
 _db = None
 _firestore_available = False
 
+# Sessions collection reference, resolved once in init_firestore() so the
+# per-write path skips a get_settings() call and a collection() lookup.
+_sessions_col = None
+
+# Turn writes are queued here and flushed in batches by a background task,
+# so the WebSocket forwarders never await a Firestore RTT inline.
+_turn_queue: asyncio.Queue | None = None
+_writer_task: asyncio.Task | None = None
+
+_BATCH_MAX_WRITES = 20
+_BATCH_WINDOW_SECONDS = 0.25
+_QUEUE_MAX = 1000
+
 
 def init_firestore() -> None:
     """Initialize Firestore client. Call once at startup."""
-    global _db, _firestore_available
+    global _db, _firestore_available, _sessions_col, _turn_queue, _writer_task
     settings = get_settings()
 
     if not settings.enable_firestore:
@@ -34,19 +48,80 @@ def init_firestore() -> None:
         else:
             _db = fs.AsyncClient()  # Uses default credentials
         _firestore_available = True
+        _sessions_col = _db.collection(settings.firestore_collection)
+        _turn_queue = asyncio.Queue(maxsize=_QUEUE_MAX)
+        _writer_task = asyncio.create_task(_drain_turn_queue())
         logger.info("Firestore initialized successfully.")
     except Exception as e:
         logger.warning(f"Firestore unavailable (running locally?): {e}")
         _firestore_available = False
 
 
+async def _commit_turn_batch(entries: list[tuple]) -> None:
+    """Write a batch of queued turns in a single Firestore commit."""
+    batch = _db.batch()
+    for session_id, role, content_type, content, timestamp in entries:
+        doc_ref = (
+            _sessions_col.document(session_id)
+            .collection("turns")
+            .document()
+        )
+        batch.set(
+            doc_ref,
+            {
+                "role": role,
+                "type": content_type,
+                "content": content,
+                "timestamp": timestamp,
+            },
+        )
+    await batch.commit()
+
+
+async def _drain_turn_queue() -> None:
+    """Background task: flush queued turns every N writes or T seconds."""
+    loop = asyncio.get_event_loop()
+    while True:
+        entries = [await _turn_queue.get()]
+        deadline = loop.time() + _BATCH_WINDOW_SECONDS
+        while len(entries) < _BATCH_MAX_WRITES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                entries.append(await asyncio.wait_for(_turn_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        try:
+            await _commit_turn_batch(entries)
+        except Exception as e:
+            logger.error("Firestore batch write error: %s", e)
+
+
+async def shutdown_firestore() -> None:
+    """Flush any queued turns and stop the background writer."""
+    if _writer_task:
+        _writer_task.cancel()
+        try:
+            await _writer_task
+        except (asyncio.CancelledError, Exception):
+            pass
+    if _turn_queue and not _turn_queue.empty():
+        entries = []
+        while not _turn_queue.empty():
+            entries.append(_turn_queue.get_nowait())
+        try:
+            await _commit_turn_batch(entries)
+        except Exception as e:
+            logger.error("Firestore final flush error: %s", e)
+
+
 async def log_session_start(session_id: str, agent_preset: str) -> None:
     """Log the start of a new session."""
     if not _firestore_available:
         return
     try:
-        settings = get_settings()
-        doc_ref = _db.collection(settings.firestore_collection).document(session_id)
+        doc_ref = _sessions_col.document(session_id)
         await doc_ref.set(
             {
                 "session_id": session_id,
@@ -56,30 +131,21 @@ async def log_session_start(session_id: str, agent_preset: str) -> None:
             }
         )
     except Exception as e:
-        logger.error(f"Firestore log_session_start error: {e}")
+        logger.error("Firestore log_session_start error: %s", e)
 
 
-async def log_turn(session_id: str, role: str, content_type: str, content: str = "") -> None:
-    """Log a single conversation turn."""
+def log_turn(session_id: str, role: str, content_type: str, content: str = "") -> None:
+    """Queue a single conversation turn for batched writing. Non-blocking."""
     if not _firestore_available:
         return
+    if len(content) > 1000:
+        content = content[:1000]
     try:
-        settings = get_settings()
-        turns_ref = (
-            _db.collection(settings.firestore_collection)
-            .document(session_id)
-            .collection("turns")
+        _turn_queue.put_nowait(
+            (session_id, role, content_type, content, time.time())
         )
-        await turns_ref.add(
-            {
-                "role": role,
-                "type": content_type,
-                "content": content[:1000],  # Truncate large content
-                "timestamp": time.time(),
-            }
-        )
-    except Exception as e:
-        logger.error(f"Firestore log_turn error: {e}")
+    except asyncio.QueueFull:
+        logger.warning("Firestore turn queue full; dropping turn log")
 
 
 async def log_session_end(session_id: str, turn_count: int) -> None:
@@ -87,8 +153,7 @@ async def log_session_end(session_id: str, turn_count: int) -> None:
     if not _firestore_available:
         return
     try:
-        settings = get_settings()
-        doc_ref = _db.collection(settings.firestore_collection).document(session_id)
+        doc_ref = _sessions_col.document(session_id)
         await doc_ref.update(
             {
                 "ended_at": time.time(),
@@ -97,4 +162,4 @@ async def log_session_end(session_id: str, turn_count: int) -> None:
             }
         )
     except Exception as e:
-        logger.error(f"Firestore log_session_end error: {e}")
\ No newline at end of file
+        logger.error("Firestore log_session_end error: %s", e)
\ No newline at end of file
@@ -3,6 +3,7 @@ Gemini Live API wrapper.
 """
 
 import asyncio
+import functools
 import logging
 import os
 import time
@@ -15,6 +16,29 @@ from app.agents.presets import AgentPreset
 
 logger = logging.getLogger(__name__)
 
+# Event tags yielded by LiveSession.receive() as (tag, payload) tuples.
+# Integer compares in the consumer replace per-event dict allocation and
+# string-key hashing on the audio hot path.
+EVENT_AUDIO = 0
+EVENT_TEXT = 1
+EVENT_INPUT_TRANSCRIPT = 2
+EVENT_INTERRUPTED = 3
+EVENT_TURN_COMPLETE = 4
+EVENT_TOOL_CALL = 5
+
+# Bound on the per-session outbound queue feeding the sender loop —
+# small enough that a dead upstream surfaces as backpressure quickly.
+_OUT_QUEUE_MAX = 32
+
+# Wire format for client microphone PCM.
+_AUDIO_MIME = "audio/pcm;rate=16000"
+
+# Transcription deltas arrive a word or sub-word at a time; buffering to
+# ~32 chars or a natural boundary before yielding turns dozens of
+# downstream JSON encodes + websocket frames per sentence into a few.
+_TEXT_COALESCE_CHARS = 32
+_TEXT_BOUNDARY_CHARS = frozenset(" .,!?;:\n")
+
 _client: genai.Client | None = None
 
 
@@ -32,123 +56,270 @@ class LiveSession:
     def __init__(self, session, preset: AgentPreset):
         self.session = session
         self.preset = preset
-        self.created_at = time.time()
+        self.created_at = time.monotonic()  # internal age, not wall time
         self.is_active = True
         self.turn_count = 0
+        # Bound per session so the sender loop reads an instance slot;
+        # the literal lives in the module-level _AUDIO_MIME constant.
+        self._audio_mime = _AUDIO_MIME
+        self._audio_buf = bytearray()
+        self._audio_last_flush = time.monotonic()
+        # Micro-batching thresholds come from settings so each deployment
+        # can tune the latency/throughput knob without a code change.
+        settings = get_settings()
+        self._audio_flush_bytes = settings.audio_flush_bytes
+        self._audio_flush_seconds = settings.audio_flush_ms / 1000.0
+        logger.debug(
+            "Audio flush thresholds: %dB / %dms",
+            self._audio_flush_bytes,
+            settings.audio_flush_ms,
+        )
+        # Pipelined sends: enqueue here, one sender loop drains. A single
+        # consumer keeps ordering trivially correct and lets bursts of
+        # queued audio coalesce into one wire write.
+        self._out_q: asyncio.Queue = asyncio.Queue(maxsize=_OUT_QUEUE_MAX)
+        self._sender_task = asyncio.create_task(self._sender_loop())
+        # Max-age watchdog for the audio buffer: armed when the first
+        # bytes are buffered, so an utterance tail still flushes when
+        # the client stops streaming (mute, VAD gating) and no further
+        # send_audio call arrives to evaluate the thresholds.
+        self._loop = asyncio.get_running_loop()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._closed = False
+
+    async def _sender_loop(self) -> None:
+        """Drain the outbound queue, coalescing adjacent audio chunks."""
+        try:
+            while True:
+                label, payload = await self._out_q.get()
+                trailing = None
+
+                if label == "audio":
+                    # Merge audio queued behind this chunk; stop at the
+                    # first non-audio item and send it right after.
+                    buf = bytearray(payload)
+                    while len(buf) < self._audio_flush_bytes and not self._out_q.empty():
+                        next_label, next_payload = self._out_q.get_nowait()
+                        if next_label == "audio":
+                            buf += next_payload
+                        else:
+                            trailing = (next_label, next_payload)
+                            break
+                    payload = types.LiveClientRealtimeInput(
+                        media_chunks=[
+                            types.Blob(
+                                data=bytes(buf),
+                                mime_type=self._audio_mime,
+                            )
+                        ]
+                    )
+
+                try:
+                    await self.session.send(input=payload)
+                    if trailing is not None:
+                        await self.session.send(input=trailing[1])
+                except Exception as e:
+                    logger.error("Error sending %s: %s", label, e)
+                    # No caller to raise to — flag the session so the
+                    # forwarders wind down.
+                    self.is_active = False
+                    return
+        except asyncio.CancelledError:
+            raise
 
     async def send_audio(self, audio_data: bytes) -> None:
         if not self.is_active:
             return
-        try:
-            await self.session.send(
-                input=types.LiveClientRealtimeInput(
-                    media_chunks=[
-                        types.Blob(
-                            data=audio_data,
-                            mime_type="audio/pcm;rate=16000",
-                        )
-                    ]
+        self._audio_buf += audio_data
+        now = time.monotonic()
+        if (
+            len(self._audio_buf) < self._audio_flush_bytes
+            and now - self._audio_last_flush < self._audio_flush_seconds
+        ):
+            if self._flush_handle is None:
+                self._flush_handle = self._loop.call_later(
+                    self._audio_flush_seconds, self._watchdog_flush
                 )
+            return
+        await self._flush_audio(now)
+
+    async def _flush_audio(self, now: float) -> None:
+        """Send the buffered PCM as one Blob and reset the buffer."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        chunk = bytes(self._audio_buf)
+        self._audio_buf.clear()
+        self._audio_last_flush = now
+        await self._out_q.put(("audio", chunk))
+
+    def _watchdog_flush(self) -> None:
+        """Timer callback: flush a buffer the thresholds never reached."""
+        self._flush_handle = None
+        if not self._audio_buf or not self.is_active:
+            return
+        chunk = bytes(self._audio_buf)
+        self._audio_buf.clear()
+        self._audio_last_flush = time.monotonic()
+        try:
+            self._out_q.put_nowait(("audio", chunk))
+        except asyncio.QueueFull:
+            # Sender is backed up — re-buffer the tail and retry; it
+            # will also ride along with the next threshold flush.
+            self._audio_buf[:0] = chunk
+            self._flush_handle = self._loop.call_later(
+                self._audio_flush_seconds, self._watchdog_flush
             )
-        except Exception as e:
-            logger.error(f"Error sending audio: {e}")
-            self.is_active = False
-            raise
 
     async def send_image(self, image_data: bytes, mime_type: str = "image/jpeg") -> None:
         if not self.is_active:
             return
-        try:
-            logger.info(f"📷 Sending image to Gemini: {len(image_data)} bytes ({mime_type})")
-            await self.session.send(
-                input=types.LiveClientRealtimeInput(
-                    media_chunks=[
-                        types.Blob(data=image_data, mime_type=mime_type)
-                    ]
-                )
-            )
-            logger.info("📷 Image sent to Gemini successfully")
-        except Exception as e:
-            logger.error(f"Error sending image: {e}", exc_info=True)
-            raise
+        logger.info(f"📷 Sending image to Gemini: {len(image_data)} bytes ({mime_type})")
+        await self._out_q.put((
+            "image",
+            types.LiveClientRealtimeInput(
+                media_chunks=[
+                    types.Blob(data=bytes(image_data), mime_type=mime_type)
+                ]
+            ),
+        ))
 
     async def send_text(self, text: str) -> None:
         if not self.is_active:
             return
-        try:
-            await self.session.send(
-                input=types.LiveClientContent(
-                    turns=[
-                        types.Content(
-                            role="user",
-                            parts=[types.Part(text=text)],
-                        )
-                    ],
-                    turn_complete=True,
-                )
-            )
-        except Exception as e:
-            logger.error(f"Error sending text: {e}")
-            raise
+        await self._out_q.put((
+            "text",
+            types.LiveClientContent(
+                turns=[
+                    types.Content(
+                        role="user",
+                        parts=[types.Part(text=text)],
+                    )
+                ],
+                turn_complete=True,
+            ),
+        ))
 
     async def receive(self):
         """
-        Async generator that yields parsed response events from Gemini.
-        Uses safe attribute access to handle varying response shapes
-        across different model versions.
+        Async generator that yields (tag, payload) event tuples from
+        Gemini (see the EVENT_* constants). The SDK response types are
+        pydantic models whose fields always exist (defaulting to None),
+        so plain attribute access replaces the old getattr-with-default
+        probes — roughly 8 fewer sentinel lookups per response; a shape
+        the model doesn't have lands in the per-message catch below.
+
+        Transcription deltas are coalesced before yielding (size or
+        word-boundary triggered, always flushed at turn boundaries) so
+        the consumer sees a few text events per sentence, not one per
+        sub-word fragment.
         """
+        txt_buf: list[str] = []
+        in_txt_buf: list[str] = []
+
+        stream = self.session.receive()
         try:
-            async for response in self.session.receive():
+            async for response in stream:
                 try:
-                    sc = getattr(response, "server_content", None)
+                    sc = response.server_content
 
                     if sc is not None:
-                        # Check for interruption
-                        if getattr(sc, "interrupted", False):
-                            yield {"type": "interrupted"}
-                            continue
+                        # Branches ordered by observed frequency on an
+                        # audio-heavy session: model_turn parts >>
+                        # transcripts >> interruption/turn flags. They
+                        # stay independent ifs (not elif) because the
+                        # Live API may bundle several fields in one
+                        # message; the flag checks are single bool reads.
 
                         # Process model output parts (audio data)
-                        model_turn = getattr(sc, "model_turn", None)
-                        if model_turn and getattr(model_turn, "parts", None):
+                        model_turn = sc.model_turn
+                        if model_turn is not None and model_turn.parts:
                             for part in model_turn.parts:
-                                inline = getattr(part, "inline_data", None)
-                                if inline and getattr(inline, "data", None):
-                                    yield {"type": "audio", "data": inline.data}
+                                inline = part.inline_data
+                                if inline is not None and inline.data:
+                                    yield (EVENT_AUDIO, inline.data)
 
-                                text = getattr(part, "text", None)
-                                if text:
-                                    yield {"type": "text", "text": text}
+                                if part.text:
+                                    yield (EVENT_TEXT, part.text)
+
+                        # Check for interruption
+                        if sc.interrupted:
+                            # Flush pending transcript first — the
+                            # interruption tracker needs everything that
+                            # was actually said.
+                            if txt_buf:
+                                yield (EVENT_TEXT, "".join(txt_buf))
+                                txt_buf.clear()
+                            if in_txt_buf:
+                                yield (EVENT_INPUT_TRANSCRIPT, "".join(in_txt_buf))
+                                in_txt_buf.clear()
+                            yield (EVENT_INTERRUPTED, None)
+                            continue
 
                         # Output transcription (agent's speech → text)
-                        out_t = getattr(sc, "output_transcription", None)
-                        if out_t and getattr(out_t, "text", None):
-                            yield {"type": "text", "text": out_t.text}
+                        out_t = sc.output_transcription
+                        if out_t is not None and out_t.text:
+                            txt_buf.append(out_t.text)
+                            if (
+                                out_t.text[-1] in _TEXT_BOUNDARY_CHARS
+                                or sum(map(len, txt_buf)) >= _TEXT_COALESCE_CHARS
+                            ):
+                                yield (EVENT_TEXT, "".join(txt_buf))
+                                txt_buf.clear()
 
                         # Input transcription (user's speech → text)
-                        in_t = getattr(sc, "input_transcription", None)
-                        if in_t and getattr(in_t, "text", None):
-                            yield {"type": "input_transcript", "text": in_t.text}
+                        in_t = sc.input_transcription
+                        if in_t is not None and in_t.text:
+                            in_txt_buf.append(in_t.text)
+                            if (
+                                in_t.text[-1] in _TEXT_BOUNDARY_CHARS
+                                or sum(map(len, in_txt_buf)) >= _TEXT_COALESCE_CHARS
+                            ):
+                                yield (EVENT_INPUT_TRANSCRIPT, "".join(in_txt_buf))
+                                in_txt_buf.clear()
 
-                        # Turn complete
-                        if getattr(sc, "turn_complete", False):
+                        # Turn complete — always flush buffered text so
+                        # nothing straddles the boundary.
+                        if sc.turn_complete:
+                            if txt_buf:
+                                yield (EVENT_TEXT, "".join(txt_buf))
+                                txt_buf.clear()
+                            if in_txt_buf:
+                                yield (EVENT_INPUT_TRANSCRIPT, "".join(in_txt_buf))
+                                in_txt_buf.clear()
                             self.turn_count += 1
-                            yield {"type": "turn_complete"}
+                            yield (EVENT_TURN_COMPLETE, None)
 
                     # Handle tool calls
-                    tc = getattr(response, "tool_call", None)
-                    if tc:
-                        yield {"type": "tool_call", "tool_call": tc}
+                    tc = response.tool_call
+                    if tc is not None:
+                        yield (EVENT_TOOL_CALL, tc)
 
                 except Exception as inner_e:
                     # Log but don't crash — one bad message shouldn't kill the session
-                    logger.warning(f"Error processing Gemini response: {inner_e}")
+                    logger.warning("Error processing Gemini response: %s", inner_e)
                     continue
 
+            # Stream ended cleanly — don't swallow trailing fragments.
+            if txt_buf:
+                yield (EVENT_TEXT, "".join(txt_buf))
+            if in_txt_buf:
+                yield (EVENT_INPUT_TRANSCRIPT, "".join(in_txt_buf))
+
         except Exception as e:
-            logger.error(f"Gemini receive stream ended: {e}")
+            logger.error("Gemini receive stream ended: %s", e)
             self.is_active = False
             raise
+        finally:
+            # Close the SDK generator deterministically instead of
+            # leaving it for GC — on cancellation this releases the
+            # underlying read immediately.
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    pass
 
     async def send_tool_response(self, function_responses: list) -> None:
         try:
@@ -158,17 +329,46 @@ class LiveSession:
                 )
             )
         except Exception as e:
-            logger.error(f"Error sending tool response: {e}")
+            logger.error("Error sending tool response: %s", e)
             raise
 
     async def close(self) -> None:
+        """Idempotent teardown: stop the sender, drop buffered audio,
+        and close the underlying SDK session when it exposes close()."""
+        if self._closed:
+            return
+        self._closed = True
         self.is_active = False
+        self._audio_buf.clear()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._sender_task.cancel()
+        try:
+            await self._sender_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        # The endpoint's `async with connect(...)` also closes the SDK
+        # session; doing it here too makes out-of-band teardown (stale
+        # cleanup, shutdown) release the connection without waiting for
+        # the context manager to unwind.
+        sdk_close = getattr(self.session, "close", None)
+        if sdk_close is not None:
+            try:
+                await sdk_close()
+            except Exception as e:
+                logger.debug("SDK session close: %s", e)
 
 
+@functools.lru_cache(maxsize=8)
 def build_live_config(preset: AgentPreset) -> dict:
     """
     Build the live connection config for a given agent preset.
     Uses dict format for maximum compatibility with the native audio model.
+
+    Presets are a small frozen set, so the config is cached per preset
+    instead of rebuilt on every connect. Callers must treat the returned
+    dict as read-only.
     """
     config = {
         "response_modalities": ["AUDIO"],
@@ -4,46 +4,125 @@ and handles cleanup of stale sessions.
 """
 
 import asyncio
+import heapq
 import logging
 import time
 import uuid
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from app.config import get_settings
-from app.services.gemini_live import LiveSession
+from app.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from app.services.gemini_live import LiveSession
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Cap the in-memory turn log so long sessions don't grow without bound.
+MAX_TURNS_PER_SESSION = 200
+
+# Per-turn content cap for the in-memory log; enforced only when content
+# actually exceeds it so short turns skip the copy.
+TURN_CONTENT_MAX_CHARS = 500
+
+# How often staged turns are formatted into the visible log.
+_TURN_FORMAT_INTERVAL_SECONDS = 0.25
+
+@dataclass(slots=True)
 class UserSession:
     """Represents one user's active connection."""
     session_id: str
-    live_session: LiveSession | None = None
-    created_at: float = field(default_factory=time.time)
-    last_activity: float = field(default_factory=time.time)
+    live_session: "LiveSession | None" = None
+    # Internal timers use the monotonic clock — immune to NTP jumps, so
+    # an idle-timeout can't fire early (or hang) on wall-clock skew.
+    # created_wall is the one wall-clock stamp, kept for display.
+    created_at: float = field(default_factory=time.monotonic)
+    last_activity: float = field(default_factory=time.monotonic)
+    created_wall: float = field(default_factory=time.time)
     agent_preset_id: str = "general"
     is_connected: bool = True
 
-    # Conversation log (in-memory, also mirrored to Firestore)
-    turns: list[dict] = field(default_factory=list)
+    # Conversation log (in-memory, also mirrored to Firestore). Bounded
+    # deque: O(1) append, oldest turns evicted past the cap.
+    turns: deque = field(default_factory=lambda: deque(maxlen=MAX_TURNS_PER_SESSION))
+
+    # Running total — len(turns) stops being the source of truth once the
+    # deque starts evicting.
+    turn_count: int = 0
+
+    # Raw turn tuples staged by the websocket hot path; a SessionManager
+    # background task formats (truncates) them into `turns` every 250ms
+    # so log_turn itself never copies content.
+    pending_turns: deque = field(default_factory=deque)
+
+    # Fire-and-forget background work (Firestore writes, etc.) spawned via
+    # spawn(); gathered at teardown so nothing blocks the hot path but no
+    # coroutine is orphaned either.
+    background_tasks: set = field(default_factory=set)
+
+    def spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background without awaiting it inline."""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
 
     def touch(self):
-        self.last_activity = time.time()
+        self.last_activity = time.monotonic()
 
     def log_turn(self, role: str, content_type: str, content: str = ""):
-        self.turns.append({
-            "role": role,
-            "type": content_type,
-            "content": content[:500],  # Truncate for memory
-            "timestamp": time.time(),
-        })
+        self.turn_count += 1
+        # Running process-wide total so get_stats stays O(1); the module
+        # singleton exists by the time any session logs a turn.
+        session_manager.turns_total += 1
+        self.pending_turns.append((role, content_type, content, time.time()))
+
+    def format_pending_turns(self) -> None:
+        """Move staged turns into the visible log, truncating content."""
+        pending = self.pending_turns
+        turns = self.turns
+        while pending:
+            role, content_type, content, timestamp = pending.popleft()
+            if len(content) > TURN_CONTENT_MAX_CHARS:
+                content = content[:TURN_CONTENT_MAX_CHARS]  # Truncate for memory
+            turns.append({
+                "role": role,
+                "type": content_type,
+                "content": content,
+                "timestamp": timestamp,
+            })
 
 class SessionManager:
     """Singleton that manages all active sessions."""
 
     def __init__(self):
+        # Hot-path settings captured once — register and cleanup_stale
+        # compare against plain ints instead of calling get_settings()
+        # per event. reload_settings() refreshes them for admin ops.
+        settings = get_settings()
+        self._max_sessions = settings.max_sessions
+        self._timeout = settings.session_timeout_seconds
+        # Deliberately lock-free: everything runs on one event loop, and
+        # the individual dict ops (len check, assignment, pop) are each
+        # atomic under the GIL — an asyncio.Lock here would only add an
+        # acquire to the connection-accept path.
         self._sessions: dict[str, UserSession] = {}
+        # Free list of recycled UserSession objects. Churny mobile
+        # clients reconnect constantly; reusing the dataclass (and its
+        # turns deque) turns register into a field reset instead of a
+        # fresh allocation per connect.
+        self._free: list[UserSession] = []
+        # Min-heap of (last_activity, session_id) with lazy deletion:
+        # cleanup pops only entries old enough to matter and re-pushes
+        # ones whose session has been active since, so a sweep costs
+        # O(expired) instead of a full walk of the sessions dict.
+        self._by_activity: list[tuple[float, str]] = []
         self._cleanup_task: asyncio.Task | None = None
+        self._format_task: asyncio.Task | None = None
+        # Turns logged across all sessions since startup (see log_turn).
+        self.turns_total = 0
 
     @property
     def active_count(self) -> int:
@@ -52,77 +131,170 @@ class SessionManager:
     def create_session_id(self) -> str:
         return str(uuid.uuid4())
 
+    def reload_settings(self) -> None:
+        """Re-read the hot-path settings captured at construction.
+
+        get_settings() returns the frozen import-time singleton, so a
+        fresh Settings() is built here to pick up changed env vars.
+        """
+        settings = Settings()
+        self._max_sessions = settings.max_sessions
+        self._timeout = settings.session_timeout_seconds
+
     def register(self, session_id: str, preset_id: str = "general") -> UserSession:
         """Register a new user session."""
-        settings = get_settings()
-        if len(self._sessions) >= settings.max_sessions:
-            raise RuntimeError(f"Max sessions ({settings.max_sessions}) reached")
+        if len(self._sessions) >= self._max_sessions:
+            raise RuntimeError(f"Max sessions ({self._max_sessions}) reached")
 
-        user_session = UserSession(
-            session_id=session_id,
-            agent_preset_id=preset_id,
-        )
+        if self._free:
+            user_session = self._free.pop()
+            now = time.monotonic()
+            user_session.session_id = session_id
+            user_session.live_session = None
+            user_session.created_at = now
+            user_session.last_activity = now
+            user_session.created_wall = time.time()
+            user_session.agent_preset_id = preset_id
+            user_session.is_connected = True
+            user_session.turns.clear()
+            user_session.pending_turns.clear()
+            user_session.turn_count = 0
+            user_session.background_tasks.clear()
+        else:
+            user_session = UserSession(
+                session_id=session_id,
+                agent_preset_id=preset_id,
+            )
         self._sessions[session_id] = user_session
+        heapq.heappush(self._by_activity, (user_session.last_activity, session_id))
         logger.info(f"Session registered: {session_id} (active={self.active_count})")
         return user_session
 
     def get(self, session_id: str) -> UserSession | None:
         return self._sessions.get(session_id)
 
-    async def remove(self, session_id: str) -> None:
-        """Clean up and remove a session."""
+    async def remove(self, session_id: str, recycle: bool = False) -> None:
+        """Clean up and remove a session.
+
+        Only the websocket endpoint's own teardown passes recycle=True:
+        at that point the forwarders have exited and nothing else holds
+        the object. Out-of-band removals (stale cleanup, the REST end
+        route, shutdown) leave it unpooled — the endpoint may still be
+        calling touch()/log_turn()/spawn() on it, and parking it on the
+        free list would let register() hand those writes to a new
+        connection.
+        """
         session = self._sessions.pop(session_id, None)
         if session and session.live_session:
             await session.live_session.close()
+        if session and session.background_tasks:
+            await asyncio.gather(*session.background_tasks, return_exceptions=True)
+        if session:
+            session.live_session = None
+            session.is_connected = False
+            if recycle:
+                self._free.append(session)
         logger.info(f"Session removed: {session_id} (active={self.active_count})")
 
     async def cleanup_stale(self) -> None:
         """Remove sessions that have been inactive past the timeout."""
-        settings = get_settings()
-        now = time.time()
-        stale_ids = [
-            sid
-            for sid, s in self._sessions.items()
-            if now - s.last_activity > settings.session_timeout_seconds
-        ]
-        for sid in stale_ids:
+        cutoff = time.monotonic() - self._timeout
+        heap = self._by_activity
+        stale_ids: list[str] = []
+        while heap and heap[0][0] <= cutoff:
+            ts, sid = heapq.heappop(heap)
+            session = self._sessions.get(sid)
+            if session is None:
+                # Session already removed — drop the dead entry.
+                continue
+            if session.last_activity > ts:
+                # Entry is stale; file the session under its real
+                # timestamp and keep sweeping.
+                heapq.heappush(heap, (session.last_activity, sid))
+                continue
             logger.warning(f"Cleaning up stale session: {sid}")
-            await self.remove(sid)
+            stale_ids.append(sid)
+
+        # Independent teardowns — overlap them instead of paying each
+        # close's network latency in sequence.
+        if stale_ids:
+            await asyncio.gather(
+                *(self.remove(sid) for sid in stale_ids),
+                return_exceptions=True,
+            )
 
     async def start_cleanup_loop(self, interval: int = 60) -> None:
-        """Background task that periodically cleans up stale sessions."""
+        """Background tasks: stale-session cleanup and turn formatting."""
         async def _loop():
             while True:
-                await asyncio.sleep(interval)
+                # Sleep until the oldest session could first go stale
+                # instead of polling on a fixed interval. Activity only
+                # pushes expiry later, so waking at the heap head's
+                # expiry can be early but never late; with no sessions,
+                # fall back to the interval and recheck.
+                heap = self._by_activity
+                if heap:
+                    sleep_for = max(1.0, heap[0][0] + self._timeout - time.monotonic())
+                else:
+                    sleep_for = interval
+                await asyncio.sleep(sleep_for)
                 try:
                     await self.cleanup_stale()
                 except Exception as e:
-                    logger.error(f"Cleanup error: {e}")
+                    logger.error("Cleanup error: %s", e)
+
+        async def _format_loop():
+            while True:
+                await asyncio.sleep(_TURN_FORMAT_INTERVAL_SECONDS)
+                try:
+                    for session in self._sessions.values():
+                        if session.pending_turns:
+                            session.format_pending_turns()
+                except Exception as e:
+                    logger.error("Turn formatting error: %s", e)
 
         self._cleanup_task = asyncio.create_task(_loop())
+        self._format_task = asyncio.create_task(_format_loop())
 
     async def shutdown(self) -> None:
         """Graceful shutdown: close all sessions."""
         if self._cleanup_task:
             self._cleanup_task.cancel()
-        for sid in list(self._sessions.keys()):
-            await self.remove(sid)
+        if self._format_task:
+            self._format_task.cancel()
+        if self._sessions:
+            # Close everything concurrently: shutdown wall time is the
+            # slowest single close, not the sum of all of them.
+            await asyncio.gather(
+                *(self.remove(sid) for sid in list(self._sessions.keys())),
+                return_exceptions=True,
+            )
         logger.info("All sessions closed.")
 
     def get_stats(self) -> dict:
+        """O(1) summary from running counters — scrape-friendly at any
+        session count. Per-session detail lives in get_sessions_page."""
         return {
             "active_sessions": self.active_count,
-            "sessions": [
-                {
-                    "session_id": s.session_id,
-                    "agent": s.agent_preset_id,
-                    "turns": len(s.turns),
-                    "connected": s.is_connected,
-                    "age_seconds": int(time.time() - s.created_at),
-                }
-                for s in self._sessions.values()
-            ],
+            "turns_total": self.turns_total,
         }
 
+    def get_sessions_page(self, offset: int = 0, limit: int = 50) -> list[dict]:
+        """A bounded slice of per-session detail (monitoring views)."""
+        # Same monotonic clock as created_at so age math can't go
+        # negative on a wall-clock step; islice walks only the window.
+        now = time.monotonic()
+        return [
+            {
+                "session_id": s.session_id,
+                "agent": s.agent_preset_id,
+                "turns": s.turn_count,
+                "connected": s.is_connected,
+                "started_at": s.created_wall,
+                "age_seconds": int(now - s.created_at),
+            }
+            for s in islice(self._sessions.values(), offset, offset + limit)
+        ]
+
 # Global singleton
 session_manager = SessionManager()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import { useRef, useState, useCallback } from "react";
-import { BACKEND_WS_URL } from "@/lib/constants";
+import { BACKEND_WS_URL, BINARY_TAG_AUDIO, BINARY_TAG_IMAGE } from "@/lib/constants";
 
 export type WSStatus = "disconnected" | "connecting" | "connected" | "error";
 
@@ -73,15 +73,27 @@ export function useWebSocket({
     setStatus("disconnected");
   }, []);
 
+  // Binary frames carry a 1-byte tag so the backend can dispatch without
+  // parsing JSON or decoding base64.
+  const sendTagged = (tag: number, payload: Uint8Array) => {
+    const frame = new Uint8Array(payload.length + 1);
+    frame[0] = tag;
+    frame.set(payload, 1);
+    wsRef.current!.send(frame);
+  };
+
   const sendAudio = useCallback((buffer: ArrayBuffer) => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
-      wsRef.current.send(buffer);
+      sendTagged(BINARY_TAG_AUDIO, new Uint8Array(buffer));
     }
   }, []);
 
   const sendImage = useCallback((base64Jpeg: string) => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
-      wsRef.current.send(JSON.stringify({ type: "image", data: base64Jpeg }));
+      const binary = atob(base64Jpeg);
+      const bytes = new Uint8Array(binary.length);
+      for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+      sendTagged(BINARY_TAG_IMAGE, bytes);
     }
   }, []);
 
@@ -9,4 +9,8 @@ export const AUDIO_RECEIVE_SAMPLE_RATE = 24000; // What Gemini sends as OUTPUT
 export const AUDIO_CHANNELS = 1;                // Mono
 export const AUDIO_CHUNK_SIZE = 4096;           // Samples per chunk
 
-export const CAMERA_FRAME_INTERVAL_MS = 1000;
\ No newline at end of file
+export const CAMERA_FRAME_INTERVAL_MS = 1000;
+
+// Binary WebSocket frame tags (must match backend ws.py)
+export const BINARY_TAG_AUDIO = 0x01; // raw PCM audio
+export const BINARY_TAG_IMAGE = 0x02; // JPEG camera frame
\ No newline at end of file